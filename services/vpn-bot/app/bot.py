@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+from sqlalchemy.engine import Row
 from telegram import ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
 from telegram.ext import (
     ApplicationBuilder,
@@ -17,8 +18,8 @@ from app.config import get_settings
 from app.db import Payment, PaymentStatusEnum, User, VPNPlan, Usage, session_scope
 from app.i18n import t
 from app.payments import grant_temp_plan
+from app.pricing import format_minor_units, get_pricing_engine, preview_currency
 
-settings = get_settings()
 logger = logging_conf.get_logger(__name__)
 
 LANGUAGE, LOCATION, DURATION, USERS, DATA, PAYMENT_PROOF = range(6)
@@ -52,10 +53,11 @@ def _choice_to_language(choice: str) -> str:
     return "fa" if "فار" in choice else "en"
 
 
-def _get_plan(filters: dict) -> VPNPlan | None:
+def _get_plan(filters: dict) -> Row | None:
+    # Select plain columns: ORM instances are expired once session_scope commits.
     with session_scope() as session:
         return (
-            session.query(VPNPlan)
+            session.query(VPNPlan.id, VPNPlan.price_eur)
             .filter_by(
                 location=filters["location"],
                 duration_months=filters["duration"],
@@ -114,8 +116,12 @@ async def choose_data(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Plan not available. Please try again.")
         return ConversationHandler.END
     context.user_data["plan_id"] = plan.id
+    prices = get_pricing_engine().snapshot()
+    currency = preview_currency(language, prices)
+    amount = prices.quote(plan.id, plan.price_eur, currency)
+    context.user_data["quote"] = (amount, currency)
     await update.message.reply_text(
-        t(language, "price_preview", price=plan.price_eur, currency=settings.base_currency),
+        t(language, "price_preview", price=format_minor_units(amount, currency), currency=currency),
         reply_markup=_confirm_keyboard(),
     )
     return PAYMENT_PROOF
@@ -140,14 +146,19 @@ async def payment_proof(update: Update, context: ContextTypes.DEFAULT_TYPE):
     with session_scope() as session:
         db_user = session.query(User).filter_by(telegram_id=user_id).first()
         plan = session.get(VPNPlan, context.user_data["plan_id"])
+        quoted_amount, quoted_currency = context.user_data["quote"]
         payment = Payment(
             user_id=db_user.id,
             plan_id=plan.id,
             amount=plan.price_eur,
+            quoted_amount_minor=quoted_amount,
+            quoted_currency=quoted_currency,
             evidence_file_id=evidence_id,
-            expires_at=datetime.utcnow() + timedelta(days=settings.auto_accept_days),
+            expires_at=datetime.utcnow() + timedelta(days=get_settings().auto_accept_days),
         )
         session.add(payment)
+        # Assign ids and make payment.plan loadable for grant_temp_plan.
+        session.flush()
         usage = grant_temp_plan(session, payment, _mock_server(plan.location))
         message = t(language, "payment_pending") + "\n" + usage.config_payload
 
@@ -166,6 +177,7 @@ def _mock_server(location: str) -> dict:
 
 async def grant_trial(update: Update, context: ContextTypes.DEFAULT_TYPE):
     language = context.user_data.get("language", "en")
+    settings = get_settings()
     user_id = update.effective_user.id
     with session_scope() as session:
         db_user = session.query(User).filter_by(telegram_id=user_id).first()
@@ -185,7 +197,7 @@ async def grant_trial(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if update.effective_user.id not in settings.admin_chat_ids:
+    if update.effective_user.id not in get_settings().admin_chat_ids:
         return
     language = context.user_data.get("language", "en")
     with session_scope() as session:
@@ -195,8 +207,11 @@ async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(t(language, "stats", users=users, plans=plans, pending=pending))
 
 
-def build_bot():
-    application = ApplicationBuilder().token(settings.telegram_token).build()
+def build_bot(post_init=None):
+    builder = ApplicationBuilder().token(get_settings().telegram_token)
+    if post_init is not None:
+        builder = builder.post_init(post_init)
+    application = builder.build()
     conv = ConversationHandler(
         entry_points=[CommandHandler("start", start)],
         states={
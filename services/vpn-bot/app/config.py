@@ -1,24 +1,38 @@
+import math
 import secrets
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
-from pydantic import BaseSettings, Field
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    telegram_token: str = Field(..., env="TELEGRAM_TOKEN")
-    admin_chat_ids: List[int] = Field(default_factory=list, env="ADMIN_CHAT_IDS")
-    database_url: str = Field(default="sqlite:///./vpn.db", env="DATABASE_URL")
+    # Fields are read from the upper-cased environment variable of the same name.
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    telegram_token: str
+    admin_chat_ids: List[int] = Field(default_factory=list)
+    database_url: str = Field(default="sqlite:///./vpn.db")
     secret_key: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     auto_accept_days: int = Field(default=3)
     trial_quota_mb: int = Field(default=200)
     trial_duration_days: int = Field(default=1)
     base_currency: str = Field(default="EUR")
+    # Units of each currency per one unit of base_currency, e.g. {"IRR": 585000}.
+    exchange_rates: Dict[str, float] = Field(default_factory=dict)
+    language_currencies: Dict[str, str] = Field(default_factory=lambda: {"fa": "IRR"})
+    admin_api_token: str | None = None
     stripe_api_key: str | None = None
     zarinpal_merchant_id: str | None = None
 
-    class Config:
-        env_file = ".env"
+    @field_validator("exchange_rates")
+    @classmethod
+    def check_exchange_rates(cls, rates: Dict[str, float]) -> Dict[str, float]:
+        for currency, rate in rates.items():
+            if not math.isfinite(rate) or rate <= 0:
+                raise ValueError(f"Exchange rate for {currency} must be a positive finite number")
+        return rates
 
 
 @lru_cache
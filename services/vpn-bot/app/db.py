@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 from sqlalchemy import (
     Boolean,
@@ -16,6 +17,7 @@ from sqlalchemy import (
     Text,
     create_engine,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 from sqlalchemy.sql import func
 
@@ -23,12 +25,20 @@ from app.config import get_settings
 
 
 Base = declarative_base()
-settings = get_settings()
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
-)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+@lru_cache
+def get_engine() -> Engine:
+    settings = get_settings()
+    return create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
+    )
+
+
+@lru_cache
+def get_session_factory() -> sessionmaker:
+    return sessionmaker(bind=get_engine(), autocommit=False, autoflush=False)
 
 
 class User(Base):
@@ -71,6 +81,9 @@ class Payment(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     plan_id = Column(Integer, ForeignKey("vpn_plans.id"), nullable=False)
     amount = Column(Float, nullable=False)
+    # Price shown to the customer, in minor units of quoted_currency.
+    quoted_amount_minor = Column(Integer)
+    quoted_currency = Column(String(3))
     status = Column(SAEnum(PaymentStatusEnum), default=PaymentStatusEnum.pending)
     evidence_file_id = Column(String(150))
     created_at = Column(DateTime, default=func.now())
@@ -112,12 +125,12 @@ class Log(Base):
 
 
 def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
 @contextmanager
 def session_scope():
-    session = SessionLocal()
+    session = get_session_factory()()
     try:
         yield session
         session.commit()
@@ -1,21 +1,88 @@
 from __future__ import annotations
 
-from threading import Thread
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from threading import Event, Thread
+from typing import TYPE_CHECKING
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from app.logging_conf import configure_logging, get_logger
 
-from app.bot import build_bot
-from app.db import Payment, Usage, User, init_db, session_scope
-from app.logging_conf import configure_logging
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+# Heavy dependencies (FastAPI, SQLAlchemy, python-telegram-bot) are imported
+# inside the functions below so that importing this module stays cheap; see
+# scripts/check_cold_start.py.
+
+logger = get_logger(__name__)
+
+_readiness = {"db": False, "bot": False}
+# Set once tables exist and prices are loaded; the bot waits on it before polling.
+_db_initialised = Event()
+
+
+def _init_database() -> None:
+    from app.db import init_db
+    from app.pricing import load_price_table
+
+    init_db()
+    load_price_table()
+    _readiness["db"] = True
+    _db_initialised.set()
+    logger.info("Database initialised")
+
+
+async def _mark_bot_ready(application) -> None:
+    _readiness["bot"] = True
+    logger.info("Telegram bot initialised")
+
+
+def _log_init_failure(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Database initialisation failed; /ready will stay 503", exc_info=exc)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Create tables in the background so /health answers immediately.
+    task = asyncio.create_task(asyncio.to_thread(_init_database))
+    task.add_done_callback(_log_init_failure)
+    yield
+    if not task.done():
+        task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
 
 
 def create_app() -> FastAPI:
+    from fastapi import Body, Depends, FastAPI, Header, HTTPException
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
+
+    from app.config import get_settings
+    from app.db import Payment, Usage, User, session_scope
+    from app.pricing import get_pricing_engine, load_price_table
+
     configure_logging()
-    init_db()
 
-    app = FastAPI(title="VPN Sales Bot API")
+    app = FastAPI(title="VPN Sales Bot API", lifespan=_lifespan)
+
+    def require_admin_token(x_admin_token: str | None = Header(default=None)) -> None:
+        # Writes are disabled unless ADMIN_API_TOKEN is configured.
+        expected = get_settings().admin_api_token
+        if not expected or not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+            raise HTTPException(status_code=403, detail="Forbidden")
+
+    def pricing_summary() -> dict:
+        snapshot = get_pricing_engine().snapshot()
+        return {
+            "base_currency": snapshot.base_currency,
+            "rates": {currency: float(rate) for currency, rate in snapshot.rates.items()},
+            "plans": len(snapshot.base_prices),
+        }
 
     app.add_middleware(
         CORSMiddleware,
@@ -29,6 +96,11 @@ def create_app() -> FastAPI:
     async def health():
         return {"status": "ok"}
 
+    @app.get("/ready")
+    async def ready():
+        status_code = 200 if all(_readiness.values()) else 503
+        return JSONResponse(status_code=status_code, content=dict(_readiness))
+
     @app.get("/admin/users")
     async def list_users():
         with session_scope() as session:
@@ -47,6 +119,8 @@ def create_app() -> FastAPI:
                     "id": p.id,
                     "status": p.status.value,
                     "amount": p.amount,
+                    "quoted_amount_minor": p.quoted_amount_minor,
+                    "quoted_currency": p.quoted_currency,
                     "user_id": p.user_id,
                     "plan_id": p.plan_id,
                     "created_at": p.created_at,
@@ -69,15 +143,41 @@ def create_app() -> FastAPI:
                 for u in usages
             ]
 
+    @app.patch("/admin/exchange-rates", dependencies=[Depends(require_admin_token)])
+    async def update_exchange_rates(rates: dict[str, float] = Body(...)):
+        try:
+            get_pricing_engine().update_rates(rates)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        return pricing_summary()
+
+    @app.post("/admin/prices/reload", dependencies=[Depends(require_admin_token)])
+    async def reload_prices():
+        await asyncio.to_thread(load_price_table)
+        return pricing_summary()
+
     return app
 
 
 def run_bot() -> None:
-    application = build_bot()
-    application.run_polling(drop_pending_updates=True)
+    from app.bot import build_bot
+
+    _db_initialised.wait()
+    try:
+        application = build_bot(post_init=_mark_bot_ready)
+        # Polling runs in a worker thread: it needs its own event loop and cannot
+        # install signal handlers (uvicorn owns those in the main thread).
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        application.run_polling(drop_pending_updates=True, stop_signals=None)
+    except Exception:
+        logger.exception("Telegram bot failed; /ready will stay 503")
+    finally:
+        _readiness["bot"] = False
 
 
 def main() -> None:
+    import uvicorn
+
     bot_thread = Thread(target=run_bot, daemon=True)
     bot_thread.start()
     uvicorn.run(create_app(), host="0.0.0.0", port=8000)
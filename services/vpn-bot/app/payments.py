@@ -6,8 +6,6 @@ from app.config import get_settings
 from app.db import Log, Payment, PaymentStatusEnum, Usage
 from app.vpn_utils import build_usage_record, create_temp_plan
 
-settings = get_settings()
-
 
 def grant_temp_plan(session: Session, payment: Payment, server: dict) -> Usage:
     temp_mb = create_temp_plan(payment.plan.data_gib)
@@ -52,7 +50,7 @@ def grant_full_plan(session: Session, payment: Payment, server: dict) -> Usage:
 
 
 def auto_accept_overdue(session: Session) -> None:
-    threshold = datetime.utcnow() - timedelta(days=settings.auto_accept_days)
+    threshold = datetime.utcnow() - timedelta(days=get_settings().auto_accept_days)
     overdue = (
         session.query(Payment)
         .filter(Payment.status == PaymentStatusEnum.pending, Payment.created_at <= threshold)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Tuple
+
+from app import logging_conf
+from app.config import get_settings
+from app.db import VPNPlan, session_scope
+
+logger = logging_conf.get_logger(__name__)
+
+# Number of decimal digits in one major unit. Unlisted currencies use 2. IRR is
+# deliberately 0 rather than the ISO 4217 exponent of 2: rials have no
+# fractional unit in practice.
+MINOR_UNIT_DIGITS = {"EUR": 2, "USD": 2, "GBP": 2, "IRR": 0, "JPY": 0}
+
+PriceTable = Dict[Tuple[int, str], int]
+
+
+def minor_digits(currency: str) -> int:
+    return MINOR_UNIT_DIGITS.get(currency.upper(), 2)
+
+
+def to_minor_units(amount: float, currency: str) -> int:
+    scale = Decimal(10) ** minor_digits(currency)
+    return int((Decimal(str(amount)) * scale).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def format_minor_units(amount: int, currency: str) -> str:
+    digits = minor_digits(currency)
+    sign = "-" if amount < 0 else ""
+    if digits == 0:
+        return f"{sign}{abs(amount):,}"
+    major, minor = divmod(abs(amount), 10**digits)
+    return f"{sign}{major:,}.{minor:0{digits}d}"
+
+
+def convert_minor_units(amount: int, source: str, target: str, rate: Decimal) -> int:
+    shift = Decimal(10) ** (minor_digits(target) - minor_digits(source))
+    return int((Decimal(amount) * rate * shift).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+class PriceSnapshot(NamedTuple):
+    """One consistent, read-only view of base prices, rates and the price table."""
+
+    base_currency: str
+    base_prices: Mapping[int, int]
+    rates: Mapping[str, Decimal]
+    table: Mapping[Tuple[int, str], int]
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        return tuple(self.rates)
+
+    def quote(self, plan_id: int, base_price: float, currency: str) -> int:
+        """Price of ``plan_id`` in ``currency`` minor units.
+
+        ``base_price`` is the plan's current base-currency price. When it no
+        longer matches the cached one (or the plan is new), the price is
+        converted with the snapshot's rates instead; neither path does I/O.
+        """
+        currency = currency.upper()
+        base_minor = to_minor_units(base_price, self.base_currency)
+        if self.base_prices.get(plan_id) == base_minor:
+            return self.table[(plan_id, currency)]
+        return convert_minor_units(base_minor, self.base_currency, currency, self.rates[currency])
+
+
+class PricingEngine:
+    """Precomputed per-plan, per-currency prices in integer minor units.
+
+    Quotes are plain dictionary lookups; the table is rebuilt off the
+    conversation path and published as a new snapshot with a single
+    assignment, so readers never see rates and prices from different builds.
+    """
+
+    def __init__(self, base_currency: str, rates: Mapping[str, float]):
+        self.base_currency = base_currency.upper()
+        self._lock = Lock()
+        self._snapshot = self._build({}, self._normalise_rates(rates))
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        return self._snapshot.currencies
+
+    def _normalise_rates(self, rates: Mapping[str, float]) -> Dict[str, Decimal]:
+        normalised = {currency.upper(): Decimal(str(rate)) for currency, rate in rates.items()}
+        for currency, rate in normalised.items():
+            if not rate.is_finite() or rate <= 0:
+                raise ValueError(f"Exchange rate for {currency} must be a positive finite number")
+        normalised[self.base_currency] = Decimal(1)
+        return normalised
+
+    def _build(self, base_prices: Dict[int, int], rates: Dict[str, Decimal]) -> PriceSnapshot:
+        table: PriceTable = {}
+        for plan_id, amount in base_prices.items():
+            for currency, rate in rates.items():
+                table[(plan_id, currency)] = convert_minor_units(amount, self.base_currency, currency, rate)
+        return PriceSnapshot(
+            self.base_currency,
+            MappingProxyType(base_prices),
+            MappingProxyType(rates),
+            MappingProxyType(table),
+        )
+
+    def load_plans(self, plans: Mapping[int, float]) -> None:
+        """Replace the plan catalogue; ``plans`` maps plan id to base-currency price."""
+        base_prices = {plan_id: to_minor_units(price, self.base_currency) for plan_id, price in plans.items()}
+        with self._lock:
+            self._snapshot = self._build(base_prices, dict(self._snapshot.rates))
+        logger.info("Price table built for %d plans in %s", len(base_prices), ", ".join(self.currencies))
+
+    def update_rates(self, rates: Mapping[str, float]) -> None:
+        """Merge ``rates`` into the current ones; currencies not mentioned are kept."""
+        normalised = self._normalise_rates(rates)
+        with self._lock:
+            snapshot = self._snapshot
+            self._snapshot = self._build(dict(snapshot.base_prices), {**snapshot.rates, **normalised})
+        logger.info("Exchange rates updated: %s", ", ".join(self.currencies))
+
+    def snapshot(self) -> PriceSnapshot:
+        return self._snapshot
+
+
+@lru_cache
+def get_pricing_engine() -> PricingEngine:
+    settings = get_settings()
+    return PricingEngine(settings.base_currency, settings.exchange_rates)
+
+
+def load_price_table() -> None:
+    """Read active plans from the database and rebuild the price table.
+
+    Call after editing plans so cached prices match the database.
+    """
+    with session_scope() as session:
+        plans = {plan.id: plan.price_eur for plan in session.query(VPNPlan).filter_by(active=True)}
+    get_pricing_engine().load_plans(plans)
+
+
+def preview_currency(language: str, snapshot: PriceSnapshot) -> str:
+    settings = get_settings()
+    currency = settings.language_currencies.get(language, settings.base_currency).upper()
+    return currency if currency in snapshot.rates else snapshot.base_currency
@@ -0,0 +1,124 @@
+"""Cold-start benchmark for the service.
+
+Run from ``services/vpn-bot``::
+
+    python scripts/check_cold_start.py
+
+Starts the API in a fresh interpreter and measures wall time from process
+start until ``GET /health`` first answers, which covers importing FastAPI,
+SQLAlchemy and the app modules plus ``create_app()`` and uvicorn startup.
+Exits non-zero when the best of ``COLD_START_RUNS`` runs exceeds
+``COLD_START_BUDGET_MS`` (default 2000 ms), or when a bare ``import app.main``
+drags in a heavy dependency.
+
+The Telegram bot is not started: polling needs a real token and network
+access, and it comes up after the API anyway. The service requirements must
+be installed; without them the checks would pass vacuously, so the script
+refuses to run.
+
+Not yet wired into CI: the repository has no pipeline (see TODO.md).
+"""
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("fastapi", "sqlalchemy", "telegram", "uvicorn", "pydantic")
+REQUIRED_MODULES = ("fastapi", "sqlalchemy", "telegram", "uvicorn")
+BUDGET_MS = float(os.environ.get("COLD_START_BUDGET_MS", "2000"))
+RUNS = int(os.environ.get("COLD_START_RUNS", "3"))
+TIMEOUT_S = 30
+
+_IMPORT_PROBE = """
+import sys
+import app.main
+print(",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+_SERVE = """
+import sys
+import uvicorn
+from app.main import create_app
+uvicorn.run(create_app(), host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+"""
+
+
+def _heavy_imports() -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=SERVICE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _time_to_health(workdir: str) -> float:
+    port = _free_port()
+    env = dict(
+        os.environ,
+        TELEGRAM_TOKEN="0:cold-start-benchmark",
+        DATABASE_URL=f"sqlite:///{workdir}/cold-start-{port}.db",
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", _SERVE, str(port)],
+        cwd=SERVICE_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - start < TIMEOUT_S:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited early:\n{process.stderr.read().decode()}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {TIMEOUT_S} s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> int:
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"FAIL: {', '.join(missing)} not installed; run pip install -r requirements.txt first")
+        return 1
+
+    heavy = _heavy_imports()
+    if heavy:
+        print(f"FAIL: importing app.main loaded {', '.join(heavy)}")
+        return 1
+
+    with tempfile.TemporaryDirectory() as workdir:
+        samples = [_time_to_health(workdir) for _ in range(RUNS)]
+
+    best_ms = min(samples)
+    print(f"process start to /health: best {best_ms:.0f} ms over {RUNS} runs (budget {BUDGET_MS:.0f} ms)")
+    if best_ms > BUDGET_MS:
+        print("FAIL: cold start exceeded budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
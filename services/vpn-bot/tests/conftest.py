@@ -0,0 +1,23 @@
+import pytest
+
+from app import main
+from app.config import get_settings
+from app.db import get_engine, get_session_factory
+from app.pricing import get_pricing_engine
+
+
+@pytest.fixture(autouse=True)
+def settings_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TELEGRAM_TOKEN", "0:test")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path}/test.db")
+    monkeypatch.setenv("EXCHANGE_RATES", '{"IRR": 585000}')
+    monkeypatch.setenv("ADMIN_API_TOKEN", "admin-token")
+    caches = (get_settings, get_engine, get_session_factory, get_pricing_engine)
+    for cached in caches:
+        cached.cache_clear()
+    monkeypatch.setattr(main, "_readiness", {"db": False, "bot": False})
+    main._db_initialised.clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.config import get_settings
+from app.db import Payment, User, VPNPlan, session_scope
+from app.pricing import get_pricing_engine
+
+ADMIN_HEADERS = {"X-Admin-Token": "admin-token"}
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.create_app()) as test_client:
+        assert main._db_initialised.wait(timeout=5)
+        yield test_client
+
+
+def test_exchange_rates_require_token(client):
+    assert client.patch("/admin/exchange-rates", json={"IRR": 1}).status_code == 403
+    response = client.patch("/admin/exchange-rates", json={"IRR": 1}, headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+    assert get_pricing_engine().snapshot().rates["IRR"] == 585000
+
+
+def test_exchange_rates_disabled_without_configured_token(client, monkeypatch):
+    monkeypatch.delenv("ADMIN_API_TOKEN")
+    get_settings.cache_clear()
+    response = client.patch("/admin/exchange-rates", json={"IRR": 1}, headers=ADMIN_HEADERS)
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("rate", [0, -5, "NaN", "Infinity"])
+def test_exchange_rates_reject_invalid_rates(client, rate):
+    response = client.patch("/admin/exchange-rates", json={"IRR": rate}, headers=ADMIN_HEADERS)
+    assert response.status_code == 422
+    assert get_pricing_engine().snapshot().rates["IRR"] == 585000
+
+
+def test_exchange_rates_merge(client):
+    response = client.patch("/admin/exchange-rates", json={"USD": 1.085}, headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    assert response.json()["rates"] == {"IRR": 585000.0, "EUR": 1.0, "USD": 1.085}
+
+
+def test_reload_prices_picks_up_plan_edits(client):
+    with session_scope() as session:
+        session.add(VPNPlan(location="france", duration_months=1, max_users=1, data_gib=10, price_eur=4.99))
+    assert client.post("/admin/prices/reload").status_code == 403
+
+    response = client.post("/admin/prices/reload", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    assert response.json()["plans"] == 1
+
+
+def test_payments_list_quoted_price(client):
+    with session_scope() as session:
+        user = User(telegram_id=1)
+        plan = VPNPlan(location="france", duration_months=1, max_users=1, data_gib=10, price_eur=4.99)
+        session.add_all([user, plan])
+        session.flush()
+        session.add(
+            Payment(
+                user_id=user.id,
+                plan_id=plan.id,
+                amount=4.99,
+                quoted_amount_minor=2919150,
+                quoted_currency="IRR",
+                expires_at=datetime(2030, 1, 1),
+            )
+        )
+
+    [payment] = client.get("/admin/payments").json()
+    assert payment["quoted_amount_minor"] == 2919150
+    assert payment["quoted_currency"] == "IRR"
+
@@ -0,0 +1,67 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app import bot
+from app.db import Payment, User, VPNPlan, init_db, session_scope
+from app.pricing import load_price_table
+
+
+@pytest.fixture
+def plan_id():
+    init_db()
+    with session_scope() as session:
+        session.add(User(telegram_id=42, username="customer"))
+        plan = VPNPlan(location="france", duration_months=1, max_users=1, data_gib=10, price_eur=4.99)
+        session.add(plan)
+        session.flush()
+        plan_id = plan.id
+    load_price_table()
+    return plan_id
+
+
+def _update(text: str):
+    message = SimpleNamespace(text=text, photo=None, document=None, reply_text=AsyncMock())
+    return SimpleNamespace(message=message, effective_user=SimpleNamespace(id=42, username="customer"))
+
+
+def _context(language: str):
+    return SimpleNamespace(user_data={"language": language, "location": "france", "duration": 1, "users": 1})
+
+
+def _choose_data(language: str):
+    update, context = _update("10 GiB"), _context(language)
+    state = asyncio.run(bot.choose_data(update, context))
+    return state, update.message.reply_text.call_args.args[0], context
+
+
+def test_choose_data_quotes_from_price_table(plan_id):
+    state, reply, context = _choose_data("fa")
+    assert state == bot.PAYMENT_PROOF
+    assert "2,919,150 IRR" in reply
+    assert context.user_data["plan_id"] == plan_id
+    assert context.user_data["quote"] == (2919150, "IRR")
+
+    _, reply, context = _choose_data("en")
+    assert "4.99 EUR" in reply
+    assert context.user_data["quote"] == (499, "EUR")
+
+
+def test_choose_data_converts_repriced_plan(plan_id):
+    with session_scope() as session:
+        session.get(VPNPlan, plan_id).price_eur = 5.99
+    _, reply, context = _choose_data("fa")
+    assert context.user_data["quote"] == (3504150, "IRR")
+
+
+def test_payment_proof_stores_quote(plan_id):
+    _, _, context = _choose_data("fa")
+    update = _update("receipt-123")
+    asyncio.run(bot.payment_proof(update, context))
+
+    with session_scope() as session:
+        payment = session.query(Payment).one()
+        assert (payment.quoted_amount_minor, payment.quoted_currency) == (2919150, "IRR")
+        assert payment.evidence_file_id == "receipt-123"
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import bot, main
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.create_app()) as test_client:
+        assert main._db_initialised.wait(timeout=5)
+        yield test_client
+
+
+def test_health_is_ok():
+    with TestClient(main.create_app()) as client:
+        assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_ready_waits_for_db_and_bot(client):
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json() == {"db": True, "bot": False}
+
+    main._readiness["bot"] = True
+    assert client.get("/ready").status_code == 200
+
+
+def test_db_init_failure_is_logged(monkeypatch, caplog):
+    # create_app() reconfigures logging, which would drop caplog's handler.
+    monkeypatch.setattr(main, "configure_logging", lambda: None)
+    monkeypatch.setenv("DATABASE_URL", "sqlite:////nonexistent/dir/vpn.db")
+    with TestClient(main.create_app()) as client:
+        deadline = time.monotonic() + 5
+        while "Database initialisation failed" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.get("/ready").status_code == 503
+    assert "Database initialisation failed" in caplog.text
+
+
+def test_bot_waits_for_db_and_logs_failure(monkeypatch, caplog):
+    calls = []
+
+    def failing_build_bot(post_init=None):
+        calls.append(main._db_initialised.is_set())
+        raise RuntimeError("bad token")
+
+    monkeypatch.setattr(bot, "build_bot", failing_build_bot)
+    main._db_initialised.set()
+    main.run_bot()
+
+    assert calls == [True]
+    assert "Telegram bot failed" in caplog.text
+    assert main._readiness["bot"] is False
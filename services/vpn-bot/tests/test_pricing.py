@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+import pytest
+
+from app.pricing import PricingEngine, convert_minor_units, format_minor_units, to_minor_units
+
+
+def test_to_minor_units_rounds_half_up():
+    assert to_minor_units(4.99, "EUR") == 499
+    assert to_minor_units(0.005, "EUR") == 1
+    assert to_minor_units(12, "IRR") == 12
+
+
+def test_convert_minor_units_between_exponents():
+    assert convert_minor_units(499, "EUR", "IRR", Decimal("585000")) == 2919150
+    assert convert_minor_units(2919150, "IRR", "EUR", Decimal("1") / Decimal("585000")) == 499
+    assert convert_minor_units(100, "EUR", "USD", Decimal("1.085")) == 109
+
+
+def test_format_minor_units():
+    assert format_minor_units(123456, "EUR") == "1,234.56"
+    assert format_minor_units(5, "EUR") == "0.05"
+    assert format_minor_units(-5, "EUR") == "-0.05"
+    assert format_minor_units(-123456, "EUR") == "-1,234.56"
+    assert format_minor_units(5844150, "IRR") == "5,844,150"
+    assert format_minor_units(-5844150, "IRR") == "-5,844,150"
+
+
+def test_engine_quotes_from_table():
+    engine = PricingEngine("eur", {"IRR": 585000})
+    engine.load_plans({1: 4.99})
+    prices = engine.snapshot()
+    assert prices.table[(1, "IRR")] == 2919150
+    assert prices.quote(1, 4.99, "EUR") == 499
+    assert prices.quote(1, 4.99, "irr") == 2919150
+
+
+def test_quote_converts_new_or_repriced_plans_with_current_rates():
+    engine = PricingEngine("EUR", {"IRR": 585000})
+    engine.load_plans({1: 4.99})
+    prices = engine.snapshot()
+    assert prices.quote(2, 10.0, "IRR") == 5850000
+    assert prices.quote(1, 5.99, "IRR") == 3504150
+
+
+def test_update_rates_merges_and_publishes_new_snapshot():
+    engine = PricingEngine("EUR", {"IRR": 585000})
+    engine.load_plans({1: 4.99})
+    before = engine.snapshot()
+    engine.update_rates({"USD": 1.085})
+    after = engine.snapshot()
+
+    assert after is not before
+    assert before.currencies == ("IRR", "EUR")
+    assert set(after.currencies) == {"IRR", "USD", "EUR"}
+    assert after.table[(1, "IRR")] == 2919150
+    assert after.table[(1, "USD")] == 541
+    with pytest.raises(TypeError):
+        after.table[(1, "EUR")] = 0
+
+
+@pytest.mark.parametrize("rate", [0, -1, float("nan"), float("inf")])
+def test_update_rates_rejects_invalid_rates(rate):
+    engine = PricingEngine("EUR", {"IRR": 585000})
+    engine.load_plans({1: 4.99})
+    with pytest.raises(ValueError):
+        engine.update_rates({"IRR": rate})
+    assert engine.snapshot().quote(1, 4.99, "IRR") == 2919150